@@ -60,17 +60,15 @@ def _extract_saved_file(output_text: str) -> Optional[str]:
 
 @app.post("/api/job-research")
 def job_research(payload: JobResearchRequest):
-    # Run the CLI script and feed inputs:
-    # mode=1, company, role, then exit
-    cli_input = f"1\n{payload.company.strip()}\n{payload.role.strip()}\nexit\n"
+    # Run the CLI script once in research mode
+    cli_args = ["--mode", "research", f"--company={payload.company.strip()}", f"--role={payload.role.strip()}"]
 
     env = os.environ.copy()
     env["PYTHONUTF8"] = "1"
     env["PYTHONIOENCODING"] = "utf-8"
 
     p = subprocess.run(
-        [sys.executable, "job_agent.py"],
-        input=cli_input,
+        [sys.executable, "job_agent.py", *cli_args],
         text=True,
         capture_output=True,
         cwd=str(PROJECT_ROOT),
@@ -97,18 +95,15 @@ def job_research(payload: JobResearchRequest):
 
 @app.post("/api/scan-inbox")
 def scan_inbox(payload: ScanInboxRequest):
-    # mode=2, dry_run y/n, then exit
-    dry = "y" if payload.dry_run else "n"
-    cli_input = f"2\n{dry}\nexit\n"
+    # Run the CLI script once in inbox mode
+    cli_args = ["--mode", "inbox", "--dry-run" if payload.dry_run else "--no-dry-run"]
 
-    
     env = os.environ.copy()
     env["PYTHONUTF8"] = "1"
     env["PYTHONIOENCODING"] = "utf-8"
 
     p = subprocess.run(
-        [sys.executable, "job_agent.py"],
-        input=cli_input,
+        [sys.executable, "job_agent.py", *cli_args],
         text=True,
         capture_output=True,
         cwd=str(PROJECT_ROOT),
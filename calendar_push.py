@@ -2,8 +2,7 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 
-from googleapiclient.discovery import build
-from google_auth_helper import get_creds
+from google_auth_helper import get_service
 
 CAL_SCOPES = ["https://www.googleapis.com/auth/calendar.events"]
 
@@ -16,8 +15,7 @@ def create_event(
     location: str = "",
     calendar_id: str = "primary",
 ) -> Dict:
-    creds = get_creds(CAL_SCOPES)
-    service = build("calendar", "v3", credentials=creds)
+    service = get_service("calendar", "v3", tuple(CAL_SCOPES))
 
     start_dt = datetime.fromisoformat(start_iso)
     end_dt = start_dt + timedelta(minutes=duration_mins)
@@ -1,8 +1,9 @@
 # contacts_google.py
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
@@ -76,6 +77,23 @@ def fetch_contacts(max_contacts: int = 500) -> List[Dict[str, str]]:
     return out
 
 
+@lru_cache(maxsize=4)
+def _contact_domains(max_contacts: int = 500) -> Tuple[Tuple[str, str, Dict[str, str]], ...]:
+    """
+    Fetch contacts once per process and pre-lowercase each email domain,
+    so repeated company lookups only scan plain strings.
+    Returns tuples of (domain, domain_without_dots, contact).
+    """
+    out = []
+    for c in fetch_contacts(max_contacts):
+        email = c["email"].lower()
+        if "@" not in email:
+            continue
+        domain = email.split("@", 1)[1]
+        out.append((domain, domain.replace(".", ""), c))
+    return tuple(out)
+
+
 def contacts_matching_company(company: str, max_hits: int = 10) -> List[Dict[str, str]]:
     """
     Heuristic match:
@@ -83,25 +101,21 @@ def contacts_matching_company(company: str, max_hits: int = 10) -> List[Dict[str
     - Also match if company word appears in email domain
     """
     company_key = company.lower().strip().replace(" ", "")
-    contacts = fetch_contacts()
 
     ranked = []
-    for c in contacts:
-        email = c["email"].lower()
+    for domain, flat_domain, c in _contact_domains():
         score = 0
 
         # domain-based match (best signal)
-        if "@" in email:
-            domain = email.split("@", 1)[1]
-            if company_key in domain.replace(".", ""):
-                score += 100
+        if company_key in flat_domain:
+            score += 100
 
-            # common big-tech: 'google' -> google.com, 'microsoft' -> microsoft.com
-            if company_key in domain:
-                score += 60
+        # common big-tech: 'google' -> google.com, 'microsoft' -> microsoft.com
+        if company_key in domain:
+            score += 60
 
         if score > 0:
             ranked.append((score, c))
 
     ranked.sort(key=lambda x: x[0], reverse=True)
-    return [c for _, c in ranked[:max_hits]]
+    return [dict(c) for _, c in ranked[:max_hits]]
@@ -3,8 +3,7 @@ import base64
 import re
 from typing import List, Dict, Optional
 
-from googleapiclient.discovery import build
-from google_auth_helper import get_creds
+from google_auth_helper import get_service
 
 GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
@@ -58,8 +57,7 @@ def fetch_recent_messages(max_results: int = 50, query: Optional[str] = None) ->
     Fetch recent Gmail messages. Optionally pass Gmail search query:
     e.g. 'newer_than:14d interview OR recruiter'
     """
-    creds = get_creds(GMAIL_SCOPES)
-    service = build("gmail", "v1", credentials=creds)
+    service = get_service("gmail", "v1", tuple(GMAIL_SCOPES))
 
     q = query or "newer_than:14d"
     res = service.users().messages().list(userId="me", q=q, maxResults=max_results).execute()
@@ -1,10 +1,12 @@
 # google_auth_helper.py
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from googleapiclient.discovery import build
 
 CREDENTIALS_FILE = Path("credentials.json")
 TOKEN_FILE = Path("token.json")
@@ -30,3 +32,14 @@ def get_creds(scopes: List[str]) -> Credentials:
         TOKEN_FILE.write_text(creds.to_json())
 
     return creds
+
+
+@lru_cache(maxsize=None)
+def get_service(api: str, version: str, scopes: Tuple[str, ...]):
+    """
+    Shared googleapiclient service per (api, version, scopes): build() and the auth
+    round-trip happen once per process, and the service's HTTP connection is reused.
+    Expired tokens are refreshed by the service's authorized transport.
+    Not thread-safe — use from one thread (or batch requests) like any built service.
+    """
+    return build(api, version, credentials=get_creds(list(scopes)))
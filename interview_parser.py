@@ -57,6 +57,15 @@ MEETING_LINK_PATTERNS = [
     r"https?://[a-z0-9.-]*webex\.com/[^\s]+",
 ]
 
+# Compiled once: one alternation per stage (C-level scan instead of N `in` checks),
+# kept in STAGE_RULES order so the first matching stage still wins.
+_STAGE_PATTERNS = [
+    (stage, re.compile("|".join(re.escape(k) for k in keys)))
+    for stage, keys in STAGE_RULES
+]
+
+_MEETING_LINK_RES = [re.compile(p, flags=re.IGNORECASE) for p in MEETING_LINK_PATTERNS]
+
 MONTH_MAP = {
     "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
     "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12
@@ -84,14 +93,14 @@ def _build_text(email: Dict[str, Any]) -> str:
 
 def classify_stage(text: str) -> str:
     t = text.lower()
-    for stage, keys in STAGE_RULES:
-        if any(k in t for k in keys):
+    for stage, pat in _STAGE_PATTERNS:
+        if pat.search(t):
             return stage
     return "Unclassified"
 
 def _find_meeting_link(text: str) -> str:
-    for pat in MEETING_LINK_PATTERNS:
-        m = re.search(pat, text, flags=re.IGNORECASE)
+    for pat in _MEETING_LINK_RES:
+        m = pat.search(text)
         if m:
             return m.group(0)
     return ""
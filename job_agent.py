@@ -15,20 +15,90 @@ if hasattr(sys.stdout, "reconfigure"):
 if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
+import argparse
+import hashlib
+import io
+import itertools
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
-
-from linkup_job import linkup_search
-from gmail_reader import fetch_recent_messages
-from interview_parser import parse_interview_details
-
-try:
-    from calendar_push import create_event
-except Exception:
-    create_event = None
-
-from past_questions import get_past_questions
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+# Heavy modules (linkup_job, gmail_reader, calendar_push, past_questions, ...)
+# are imported inside the methods that use them, so `--help` and a single
+# mode don't pay for google-api / linkup imports they never touch.
+
+
+# Inbox summary stages, in display order (interview_parser stage names)
+STAGES = (
+    "Assessment",
+    "Phone Screen",
+    "Technical Interview",
+    "Onsite / Final",
+    "Recruiter / Scheduling",
+    "Unclassified",
+)
+STAGE_IDX = {s: i for i, s in enumerate(STAGES)}
+_UNCLASSIFIED_IDX = STAGE_IDX["Unclassified"]
+
+# Interview themes + 7-day plan (static; returned by reference)
+_THEMES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "coding_topics": ("dp", "arrays", "strings", "hashmap", "stack/queue", "binary search", "trees", "graphs"),
+    "system_design": ("queues/streams", "auth"),
+    "behavioral": ("collaboration", "execution", "ownership"),
+})
+_PLAN_7 = (
+    "Day 1: dp + arrays (2 medium problems)",
+    "Day 2: strings + hashmap (2 medium problems)",
+    "Day 3: stack/queue (2 medium) + review mistakes",
+    "Day 4: binary search (2 medium) + 1 timed set (45–60 min)",
+    "Day 5: System Design — queues/streams + auth (write 1 full design doc)",
+    "Day 6: System Design — caching + API + data model + scaling checklist",
+    "Day 7: Mock interview (coding + behavioral). Behavioral: collaboration, execution, ownership",
+)
+_SYSTEM_DESIGN_PRIMER_LINK = "System Design Primer (GitHub) — https://github.com/donnemartin/system-design-primer"
+
+# 30-day study plans (shared, immutable)
+_PLAN_AI = (
+    "Week 1: Linear Algebra + Probability + ML fundamentals",
+    "Week 2: Supervised learning + Feature engineering + Model evaluation",
+    "Week 3: Deep Learning (CNN/RNN/Transformers) + PyTorch practice",
+    "Week 4: ML System Design (serving, scaling, monitoring) + 3 mock interviews",
+)
+_PLAN_BACKEND = (
+    "Week 1: Arrays, Strings, Hashmaps (15 problems)",
+    "Week 2: Trees, Graphs, DP (15 problems)",
+    "Week 3: Backend fundamentals (REST, DB indexing, caching, auth)",
+    "Week 4: Distributed system design + 3 mock interviews",
+)
+_PLAN_FRONTEND = (
+    "Week 1: JavaScript fundamentals + closures + async",
+    "Week 2: React internals + state management + performance",
+    "Week 3: Frontend system design (SSR, caching, APIs)",
+    "Week 4: Build 1 production project + 3 mock interviews",
+)
+_PLAN_DATA = (
+    "Week 1: SQL advanced (joins, window functions)",
+    "Week 2: Statistics + probability + A/B testing",
+    "Week 3: Python data pipelines (pandas, numpy)",
+    "Week 4: Case studies + ML basics + mocks",
+)
+_PLAN_DEFAULT = (
+    "Week 1: Arrays, Strings, Hashmaps (15 problems)",
+    "Week 2: Trees, Graphs, DP (15 problems)",
+    "Week 3: System Design fundamentals + caching + scaling",
+    "Week 4: Timed mocks (coding + behavioral)",
+)
+# first keyword found in the lowercased role wins
+_ROLE_PLANS = (
+    ("ai", _PLAN_AI),
+    ("ml", _PLAN_AI),
+    ("backend", _PLAN_BACKEND),
+    ("frontend", _PLAN_FRONTEND),
+    ("data", _PLAN_DATA),
+)
 
 
 # -----------------------------
@@ -67,11 +137,22 @@ def _as_dict(res: Any) -> Dict[str, Any]:
     return out
 
 
+def _brief_digest(brief: str) -> str:
+    """
+    Content hash of a candidate brief, ignoring the "Generated:" timestamp line
+    so a rerun with unchanged Linkup answers hashes the same.
+    """
+    body = "\n".join(l for l in brief.split("\n") if not l.startswith("Generated: "))
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def fetch_recent_emails(days: int = 30, max_results: int = 50) -> List[Dict[str, Any]]:
     """
     Wrapper over gmail_reader.fetch_recent_messages() to match the old signature.
     Uses Gmail query newer_than:Xd to reduce scanning.
     """
+    from gmail_reader import fetch_recent_messages
+
     query = f"newer_than:{days}d"
     return fetch_recent_messages(max_results=max_results, query=query)
 
@@ -93,7 +174,12 @@ class JobIntelligenceAgent:
         print(f"Role: {role}\n")
 
         print("1️⃣  Running Linkup research (recent-focused)...")
-        bundle = self.build_research_bundle(company, role)
+        # Past questions (CSV + possible Linkup auto-fetch) don't depend on the
+        # research results, so run both I/O-bound steps at the same time.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_past = ex.submit(self.load_past_questions, company, role)
+            bundle = self.build_research_bundle(company, role)
+            bundle["past_questions"] = f_past.result()
         print("   ✓ Research complete\n")
 
         print("2️⃣  Writing candidate brief (highlights + links + jobs + past questions)...")
@@ -106,8 +192,21 @@ class JobIntelligenceAgent:
         safe_role = role.replace(" ", "_")
         filename = f"prep_{safe_company}_{safe_role}.txt"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(brief)
+        # Skip the write when the existing prep doc has the same content
+        doc_path = Path(filename)
+        unchanged = False
+        if doc_path.exists():
+            try:
+                old_brief = doc_path.read_bytes().decode("utf-8", errors="replace")
+                unchanged = _brief_digest(old_brief) == _brief_digest(brief)
+            except OSError:
+                unchanged = False
+
+        if unchanged:
+            print("\n   (brief unchanged since last run — file left as-is)")
+        else:
+            # one encode + one write call; no text-mode file object
+            doc_path.write_bytes(brief.encode("utf-8"))
 
         print(f"\n💾 Saved brief to: {filename}")
 
@@ -118,23 +217,30 @@ class JobIntelligenceAgent:
         return filename
 
     def build_research_bundle(self, company: str, role: str) -> Dict[str, Any]:
+        from linkup_job import linkup_search
+
         queries = [
             f"{company} latest news last 30 days",
             f"{company} {role} interview experience",
             f"{company} {role} hiring update 2026",
         ]
 
+        job_query = f"{company} {role} job posting last 7 days"
+
+        # All 4 searches are independent blocking HTTP calls -> run them together
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            raws = list(ex.map(linkup_search, queries + [job_query]))
+
         results: List[Dict[str, Any]] = []
-        for q in queries:
-            raw = linkup_search(q)               # your normalized output from linkup_job.py
-            res = _as_dict(raw)
+        for q, raw in zip(queries, raws):
+            res = _as_dict(raw)                  # your normalized output from linkup_job.py
             results.append({
                 "query": q,
                 "answer_bullets": self.extract_bullets(res),
                 "top_sources": (res.get("sources") or [])[:3],
             })
 
-        job_search = _as_dict(linkup_search(f"{company} {role} job posting last 7 days"))
+        job_search = _as_dict(raws[-1])
         recent_jobs = (job_search.get("sources") or [])[:5]
 
         return {
@@ -145,87 +251,58 @@ class JobIntelligenceAgent:
         }
 
     def extract_bullets(self, res: Any) -> List[str]:
-        res = _as_dict(res)
+        # build_research_bundle already hands us the normalized dict;
+        # only convert raw SDK objects so model_dump() runs once per result.
+        if not isinstance(res, dict):
+            res = _as_dict(res)
         text = (res.get("answer") or "").strip()
 
-        lines: List[str] = []
-        for l in text.split("\n"):
-            s = l.strip().lstrip("-•").strip()
-            if len(s) >= 25:
-                lines.append(s)
-        return lines[:6]
+        # lazily strip lines and stop after the first 6 usable ones
+        gen = (s for l in io.StringIO(text) if len(s := l.strip().lstrip("-•").strip()) >= 25)
+        return list(itertools.islice(gen, 6))
 
     # -----------------------------------------------------
     # Interview themes + plans
     # -----------------------------------------------------
 
-    def public_interview_themes(self) -> Dict[str, List[str]]:
-        return {
-            "coding_topics": ["dp", "arrays", "strings", "hashmap", "stack/queue", "binary search", "trees", "graphs"],
-            "system_design": ["queues/streams", "auth"],
-            "behavioral": ["collaboration", "execution", "ownership"],
-        }
+    def public_interview_themes(self) -> Mapping[str, Tuple[str, ...]]:
+        return _THEMES
 
-    def prep_plan_7_day(self) -> List[str]:
-        return [
-            "Day 1: dp + arrays (2 medium problems)",
-            "Day 2: strings + hashmap (2 medium problems)",
-            "Day 3: stack/queue (2 medium) + review mistakes",
-            "Day 4: binary search (2 medium) + 1 timed set (45–60 min)",
-            "Day 5: System Design — queues/streams + auth (write 1 full design doc)",
-            "Day 6: System Design — caching + API + data model + scaling checklist",
-            "Day 7: Mock interview (coding + behavioral). Behavioral: collaboration, execution, ownership",
-        ]
+    def prep_plan_7_day(self) -> Tuple[str, ...]:
+        return _PLAN_7
 
-    def best_interview_links(self, company: str, role: str) -> List[str]:
-        query = urllib.parse.quote_plus(f"{company} {role}")
+    def best_interview_links(self, company: str, role: str, query: Optional[str] = None) -> List[str]:
+        # query: already quote_plus'd "company role" (format_candidate_brief passes it in)
+        if query is None:
+            query = urllib.parse.quote_plus(f"{company} {role}")
         return [
             f"LeetCode Discuss — https://leetcode.com/discuss/?query={query}",
             f"GeeksforGeeks — https://www.google.com/search?q=site:geeksforgeeks.org+{query}+interview+questions",
-            "System Design Primer (GitHub) — https://github.com/donnemartin/system-design-primer",
+            _SYSTEM_DESIGN_PRIMER_LINK,
         ]
 
-    def build_30_day_study_plan(self, role: str) -> List[str]:
+    def build_30_day_study_plan(self, role: str) -> Tuple[str, ...]:
         r = (role or "").lower()
+        for kw, plan in _ROLE_PLANS:
+            if kw in r:
+                return plan
+        return _PLAN_DEFAULT
 
-        if "ai" in r or "ml" in r:
-            return [
-                "Week 1: Linear Algebra + Probability + ML fundamentals",
-                "Week 2: Supervised learning + Feature engineering + Model evaluation",
-                "Week 3: Deep Learning (CNN/RNN/Transformers) + PyTorch practice",
-                "Week 4: ML System Design (serving, scaling, monitoring) + 3 mock interviews",
-            ]
-
-        if "backend" in r:
-            return [
-                "Week 1: Arrays, Strings, Hashmaps (15 problems)",
-                "Week 2: Trees, Graphs, DP (15 problems)",
-                "Week 3: Backend fundamentals (REST, DB indexing, caching, auth)",
-                "Week 4: Distributed system design + 3 mock interviews",
-            ]
-
-        if "frontend" in r:
-            return [
-                "Week 1: JavaScript fundamentals + closures + async",
-                "Week 2: React internals + state management + performance",
-                "Week 3: Frontend system design (SSR, caching, APIs)",
-                "Week 4: Build 1 production project + 3 mock interviews",
-            ]
-
-        if "data" in r:
-            return [
-                "Week 1: SQL advanced (joins, window functions)",
-                "Week 2: Statistics + probability + A/B testing",
-                "Week 3: Python data pipelines (pandas, numpy)",
-                "Week 4: Case studies + ML basics + mocks",
-            ]
+    def load_past_questions(self, company: str, role: str) -> Tuple[List[Dict[str, str]], str]:
+        """Returns (rows, error). Never crash if CSV is messy."""
+        try:
+            from past_questions import get_past_questions
 
-        return [
-            "Week 1: Arrays, Strings, Hashmaps (15 problems)",
-            "Week 2: Trees, Graphs, DP (15 problems)",
-            "Week 3: System Design fundamentals + caching + scaling",
-            "Week 4: Timed mocks (coding + behavioral)",
-        ]
+            past_qs = get_past_questions(
+                company,
+                role,
+                csv_path="past_questions.csv",
+                limit=8,
+                auto_fetch_if_missing=True,
+            )
+            return past_qs, ""
+        except Exception as e:
+            return [], str(e)
 
     # -----------------------------------------------------
     # Candidate brief formatting
@@ -235,129 +312,105 @@ class JobIntelligenceAgent:
         company = bundle["company"]
         role = bundle["role"]
 
-        merged_bullets: List[str] = []
-        all_sources: List[Dict[str, str]] = []
-        for r in bundle["results"]:
-            merged_bullets.extend(r.get("answer_bullets") or [])
-            all_sources.extend(r.get("top_sources") or [])
-
-        # dedupe bullets
+        # dedupe bullets + links in a single pass over the results
         seen = set()
-        final_bullets: List[str] = []
-        for b in merged_bullets:
-            k = b.lower()
-            if k in seen:
-                continue
-            seen.add(k)
-            final_bullets.append(b)
-            if len(final_bullets) >= 6:
-                break
-
-        # dedupe links
         used = set()
+        final_bullets: List[str] = []
         final_links: List[Dict[str, str]] = []
-        for s in all_sources:
-            url = (s.get("url") or "").strip()
-            if not url or url in used:
-                continue
-            used.add(url)
-            final_links.append(s)
-            if len(final_links) >= 3:
+        for r in bundle["results"]:
+            for b in r.get("answer_bullets") or []:
+                if len(final_bullets) >= 6:
+                    break
+                k = b.lower()
+                if k in seen:
+                    continue
+                seen.add(k)
+                final_bullets.append(b)
+
+            for s in r.get("top_sources") or []:
+                if len(final_links) >= 3:
+                    break
+                url = (s.get("url") or "").strip()
+                if not url or url in used:
+                    continue
+                used.add(url)
+                final_links.append(s)
+
+            if len(final_bullets) >= 6 and len(final_links) >= 3:
                 break
 
-        # Past questions — never crash if CSV is messy
-        try:
-            past_qs = get_past_questions(
-                company,
-                role,
-                csv_path="past_questions.csv",
-                limit=8,
-                auto_fetch_if_missing=True,
-            )
-            past_qs_error = ""
-        except Exception as e:
-            past_qs = []
-            past_qs_error = str(e)
+        # Past questions — process_job prefetches them alongside the research
+        if "past_questions" in bundle:
+            past_qs, past_qs_error = bundle["past_questions"]
+        else:
+            past_qs, past_qs_error = self.load_past_questions(company, role)
 
         themes = self.public_interview_themes()
         plan_7 = self.prep_plan_7_day()
         plan_30 = self.build_30_day_study_plan(role)
-        best_links = self.best_interview_links(company, role)
+        q = urllib.parse.quote_plus(f"{company} {role}")
+        best_links = self.best_interview_links(company, role, query=q)
+
+        # One write per section (each starts with "\n" so sections join cleanly)
+        out = io.StringIO()
+        w = out.write
 
-        lines: List[str] = []
-        lines.append(f"RECENT JOB BRIEF — {company} ({role})")
-        lines.append(f"Generated: {datetime.now().isoformat()}")
-        lines.append("")
+        w(f"RECENT JOB BRIEF — {company} ({role})\nGenerated: {datetime.now().isoformat()}\n")
 
-        lines.append("✅ Recent highlights (min reading, max signal):")
+        w("\n✅ Recent highlights (min reading, max signal):\n")
         if final_bullets:
-            for i, b in enumerate(final_bullets, 1):
-                lines.append(f"{i}. {b}")
+            w("\n".join(f"{i}. {b}" for i, b in enumerate(final_bullets, 1)))
         else:
-            lines.append("- No highlights found (Linkup returned limited data).")
+            w("- No highlights found (Linkup returned limited data).")
 
-        lines.append("")
-        lines.append("🔗 Top links (read max 3):")
+        w("\n\n🔗 Top links (read max 3):\n")
         if final_links:
-            for s in final_links:
-                lines.append(f"- {s.get('title','Source')} — {s.get('url','')}")
+            w("\n".join(f"- {s.get('title','Source')} — {s.get('url','')}" for s in final_links))
         else:
             # Always provide clickable links even when LinkUp sources are empty
-            q = urllib.parse.quote_plus(f"{company} {role}")
-            fallback_links = [
-                ("Google News", f"https://www.google.com/search?q={urllib.parse.quote_plus(company)}+latest+news&tbm=nws"),
-                ("LinkedIn Jobs", f"https://www.linkedin.com/jobs/search/?keywords={q}"),
-                ("Indeed", f"https://www.indeed.com/jobs?q={q}"),
-            ]
-            for title, url in fallback_links:
-                lines.append(f"- {title} — {url}")
-
-        lines.append("")
-        lines.append("🧑‍💻 Recent job postings (last 7 days bias; max 5):")
+            w(
+                f"- Google News — https://www.google.com/search?q={urllib.parse.quote_plus(company)}+latest+news&tbm=nws\n"
+                f"- LinkedIn Jobs — https://www.linkedin.com/jobs/search/?keywords={q}\n"
+                f"- Indeed — https://www.indeed.com/jobs?q={q}"
+            )
+
+        w("\n\n🧑‍💻 Recent job postings (last 7 days bias; max 5):\n")
         recent_jobs = bundle.get("recent_jobs") or []
         if recent_jobs:
-            for j in recent_jobs[:5]:
-                lines.append(f"- {j.get('title','Job posting')} — {j.get('url','')}")
+            w("\n".join(f"- {j.get('title','Job posting')} — {j.get('url','')}" for j in recent_jobs[:5]))
         else:
-            lines.append("- None found (try role synonyms like 'SWE' / 'Software Engineer').")
+            w("- None found (try role synonyms like 'SWE' / 'Software Engineer').")
 
-        lines.append("")
-        lines.append("🧠 Past interview questions (from your CSV; auto-fetched if missing):")
+        w("\n\n🧠 Past interview questions (from your CSV; auto-fetched if missing):\n")
         if past_qs:
-            for row in past_qs:
-                stage = row.get("stage", "Mixed")
-                topic = row.get("topic", "General")
-                diff = row.get("difficulty", "Unknown")
-                q = (row.get("question") or "").strip()
-                src = (row.get("source") or "").strip()
-                lines.append(f"- [{stage}] {topic} ({diff}): {q} — {src}")
+            w("\n".join(
+                f"- [{row.get('stage', 'Mixed')}] {row.get('topic', 'General')} "
+                f"({row.get('difficulty', 'Unknown')}): {(row.get('question') or '').strip()} "
+                f"— {(row.get('source') or '').strip()}"
+                for row in past_qs
+            ))
         else:
-            lines.append("- No questions found.")
+            w("- No questions found.")
             if past_qs_error:
-                lines.append(f"  (debug: past_questions error: {past_qs_error})")
+                w(f"\n  (debug: past_questions error: {past_qs_error})")
 
-        lines.append("")
-        lines.append("🧠 Interview themes (from public sources):")
-        lines.append(f"• Coding topics: {', '.join(themes['coding_topics'])}")
-        lines.append(f"• System design: {', '.join(themes['system_design'])}")
-        lines.append(f"• Behavioral themes: {', '.join(themes['behavioral'])}")
+        w(
+            "\n\n🧠 Interview themes (from public sources):\n"
+            f"• Coding topics: {', '.join(themes['coding_topics'])}\n"
+            f"• System design: {', '.join(themes['system_design'])}\n"
+            f"• Behavioral themes: {', '.join(themes['behavioral'])}"
+        )
 
-        lines.append("")
-        lines.append("📅 7-day prep plan (auto-generated):")
-        for d in plan_7:
-            lines.append(f"• {d}")
+        w("\n\n📅 7-day prep plan (auto-generated):")
+        w("".join(f"\n• {d}" for d in plan_7))
 
-        lines.append("")
-        lines.append("📅 30-day study plan (role-specific):")
-        for w in plan_30:
-            lines.append(f"• {w}")
+        w("\n\n📅 30-day study plan (role-specific):")
+        w("".join(f"\n• {wk}" for wk in plan_30))
 
-        lines.append("")
-        lines.append("🔗 Best interview links (read 2–3):")
-        for l in best_links[:4]:
-            lines.append(f"• {l}")
+        w("\n\n🔗 Best interview links (read 2–3):")
+        w("".join(f"\n• {l}" for l in best_links[:4]))
 
-        return "\n".join(lines)
+        return out.getvalue()
 
     # =====================================================
     # ============== EMAIL SCAN MODE ======================
@@ -368,17 +421,18 @@ class JobIntelligenceAgent:
         print("📩 INBOX SCAN → SUMMARY (Interview / Assessment)")
         print("=" * 70)
 
+        from interview_parser import parse_interview_details
+
+        try:
+            from calendar_push import create_event
+        except Exception:
+            create_event = None
+
         emails = fetch_recent_emails(days=30, max_results=max_emails)
         print(f"Fetched {len(emails)} emails.\n")
 
-        summary = {
-            "Assessment": [],
-            "Phone Screen": [],
-            "Technical Interview": [],
-            "Onsite / Final": [],
-            "Recruiter / Scheduling": [],
-            "Unclassified": [],
-        }
+        # one bucket per stage, indexed by STAGE_IDX
+        buckets: List[List[str]] = [[] for _ in STAGES]
 
         calendar_ready: List[Tuple[str, str]] = []
         created = 0
@@ -393,7 +447,7 @@ class JobIntelligenceAgent:
             subject = e.get("subject") or ""
             entry = f"{company}: {subject}"
 
-            summary.setdefault(stage, []).append(entry)
+            buckets[STAGE_IDX.get(stage, _UNCLASSIFIED_IDX)].append(entry)
 
             start_iso = parsed.get("start_iso")
             if start_iso:
@@ -412,15 +466,14 @@ class JobIntelligenceAgent:
                         pass
 
         print("📊 INTERVIEW SUMMARY\n")
-        for k in ["Assessment", "Phone Screen", "Technical Interview", "Onsite / Final", "Recruiter / Scheduling", "Unclassified"]:
-            v = summary.get(k, [])
+        for k, v in zip(STAGES, buckets):
             print(f"{k} ({len(v)})")
 
         print("\n" + "=" * 70)
         print("\n🟡 Action needed / not scheduled yet (showing up to 12)")
         shown = 0
-        for k in ["Assessment", "Phone Screen", "Technical Interview", "Onsite / Final", "Recruiter / Scheduling", "Unclassified"]:
-            for item in summary.get(k, [])[:12]:
+        for k, v in zip(STAGES, buckets):
+            for item in v[:12]:
                 if shown >= 12:
                     break
                 print(f"• [{k}] {item}")
@@ -438,9 +491,7 @@ class JobIntelligenceAgent:
         print("=" * 70)
 
 
-if __name__ == "__main__":
-    agent = JobIntelligenceAgent()
-
+def _interactive_loop(agent: JobIntelligenceAgent) -> None:
     while True:
         mode = input("\nChoose mode: (1) Job Research  (2) Scan Inbox->Calendar  (exit): ").strip().lower()
 
@@ -460,3 +511,42 @@ if __name__ == "__main__":
             continue
 
         print("Invalid option. Type 1, 2, or exit.")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Single-shot CLI for scripted/cron use; falls back to the interactive
+    menu when no --mode is given (or with --interactive).
+    """
+    ap = argparse.ArgumentParser(description="Job Intelligence Agent")
+    ap.add_argument("--mode", choices=["research", "inbox"], help="run one mode and exit")
+    ap.add_argument("--company", help="company name (research mode)")
+    ap.add_argument("--role", help="role title (research mode)")
+    ap.add_argument(
+        "--dry-run",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="inbox mode: only summarize, don't create calendar events (default: on)",
+    )
+    ap.add_argument("--max-emails", type=int, default=50, help="inbox mode: emails to scan (default: 50)")
+    ap.add_argument("--interactive", action="store_true", help="run the interactive menu")
+    args = ap.parse_args(argv)
+
+    agent = JobIntelligenceAgent()
+
+    if args.interactive or not args.mode:
+        _interactive_loop(agent)
+        return 0
+
+    if args.mode == "research":
+        if not args.company or not args.role:
+            ap.error("--mode research requires --company and --role")
+        agent.process_job(args.company.strip(), args.role.strip())
+        return 0
+
+    agent.scan_inbox_and_push_interviews(max_emails=args.max_emails, dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,20 @@
 # linkedin_referrals.py
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from linkup_job import linkup_search
 
-LINKEDIN_PROFILE_PATTERNS = [
-    r"https?://(?:www\.)?linkedin\.com/in/[^\s\)\]]+",
-    r"https?://(?:www\.)?linkedin\.com/pub/[^\s\)\]]+",
-]
+# /in/ and /pub/ profile URLs in one pattern -> one scan per blob
+_LINKEDIN_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/(?:in|pub)/[^\s\)\]]+")
 
 def _extract_linkedin_urls(text: str):
+    seen = set()
     urls = []
-    for pat in LINKEDIN_PROFILE_PATTERNS:
-        urls.extend(re.findall(pat, text))
-    return list(dict.fromkeys(urls))
+    for u in _LINKEDIN_RE.findall(text):
+        if u not in seen:
+            seen.add(u)
+            urls.append(u)
+    return urls
 
 def _normalize(url: str) -> str:
     try:
@@ -29,17 +31,22 @@ def _shorten(text: str, n: int = 160) -> str:
         return t
     return t[:n].rsplit(" ", 1)[0].rstrip() + "..."
 
-def _collect_candidates(sources):
+def _collect_candidates(sources, max_people=None):
     people = []
     seen = set()
 
     for s in sources:
+        if max_people is not None and len(people) >= max_people:
+            break
+
         title = (s.get("title", "") or "").strip()
         snippet = (s.get("snippet", "") or "").strip()
         url = (s.get("url", "") or "").strip()
 
         blob = f"{title}\n{snippet}\n{url}"
         for li in _extract_linkedin_urls(blob):
+            if max_people is not None and len(people) >= max_people:
+                break
             li = _normalize(li)
             if li in seen:
                 continue
@@ -71,10 +78,12 @@ def find_referrals(company: str, role: str, max_people: int = 8):
 ]
 
 
-    all_sources = []
-    for q in queries:
-        resp = linkup_search(q)
+    # independent blocking searches -> run them together, normalize in order below
+    with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+        responses = list(ex.map(linkup_search, queries))
 
+    all_sources = []
+    for resp in responses:
         # Case 1: our wrapper returned a dict fallback
         if isinstance(resp, dict):
             srcs = resp.get("sources", []) or []
@@ -97,6 +106,5 @@ def find_referrals(company: str, role: str, max_people: int = 8):
                 "snippet": getattr(s, "snippet", "") or "",
             })
 
-    candidates = _collect_candidates(all_sources)
-    return candidates[:max_people]
+    return _collect_candidates(all_sources, max_people)
 
@@ -1,8 +1,17 @@
 # linkup_job.py
+import copy
+import dataclasses
+import hashlib
+import json
 import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from operator import methodcaller
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,39 +22,162 @@ except Exception:
     LinkupClient = None
 
 
+# Precompiled privacy filters used by sanitize_query
+_RE_EMAIL = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
+_RE_PHONE = re.compile(r"\b(\+?\d[\d\-\s]{7,}\d)\b")
+_RE_ID = re.compile(r"\b\d{8,}\b")
+
+# LINKUP_DEBUG=1 keeps the raw SDK payload in normalized results
+_DEBUG = os.getenv("LINKUP_DEBUG") == "1"
+
+# Shared LinkupClient, built lazily by get_client()
+_CLIENT = None
+
+# Keys normalize_linkup_response looks under for the answer text / source list
+_ANSWER_KEYS = ("answer", "sourcedAnswer", "text", "output", "result")
+_SOURCE_KEYS = ("sources", "citations", "references")
+# Usable sources kept per result; briefs show the top few, but find_referrals
+# scans every kept source for LinkedIn URLs, so keep this generous
+_MAX_SOURCES = 20
+
+# (depth, output_type) combos tried in order by linkup_search
+_CANDIDATES: Tuple[Tuple[str, str], ...] = (
+    ("shallow", "sourcedAnswer"),
+    ("standard", "sourcedAnswer"),
+    ("deep", "sourcedAnswer"),
+    ("shallow", "answer"),
+    ("standard", "answer"),
+    ("shallow", "text"),
+)
+# Only this output type carries sources; the others are last-resort fallbacks
+_PREFERRED_OUTPUT = "sourcedAnswer"
+# Last sourcedAnswer combo that succeeded; tried first on the next call.
+# Fallback output types are never pinned, and the pin expires so the
+# preferred (cheapest-first) order is retried after a transient failure.
+_LAST_GOOD: Optional[Tuple[str, str]] = None
+_LAST_GOOD_AT = 0.0
+_LAST_GOOD_TTL_SECONDS = 300
+_RE_5XX = re.compile(r"\b5\d\d\b")
+
+
+# In-process LRU + TTL cache of successful searches, keyed by sanitized query
+_CACHE_TTL_SECONDS = 900
+_CACHE_MAX_ENTRIES = 256
+_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is None:
+            return None
+        ts, value = hit
+        if time.time() - ts >= _CACHE_TTL_SECONDS:
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: str, value: Dict[str, Any]) -> None:
+    with _cache_lock:
+        _cache[key] = (time.time(), value)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+# On-disk cache of successful searches, shared across runs: $CACHE_DIR/linkup/{sha256(query)}.json.
+# Layout and expiry rules are described under "Caching" in the README (src/llm_cache.py follows them too).
+_DISK_CACHE_DIR = Path(os.getenv("CACHE_DIR") or Path(__file__).resolve().parent / "cache") / "linkup"
+_DISK_CACHE_TTL_SECONDS = int(os.getenv("LINKUP_CACHE_TTL_SECONDS", str(24 * 3600)))
+
+
+def _disk_cache_path(key: str) -> Path:
+    return _DISK_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _disk_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    path = _disk_cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime >= _DISK_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            value = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _disk_cache_put(key: str, value: Dict[str, Any]) -> None:
+    """Store value under key (best-effort)."""
+    if _DISK_CACHE_TTL_SECONDS <= 0:
+        return
+    path = _disk_cache_path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f, default=str)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
 def sanitize_query(text: str) -> str:
     """Privacy-first: remove emails, phone-like strings, and long IDs from queries."""
-    text = re.sub(r"\b[\w\.-]+@[\w\.-]+\.\w+\b", "[redacted_email]", text)
-    text = re.sub(r"\b(\+?\d[\d\-\s]{7,}\d)\b", "[redacted_phone]", text)
-    text = re.sub(r"\b\d{8,}\b", "[redacted_id]", text)
+    text = _RE_EMAIL.sub("[redacted_email]", text)
+    text = _RE_PHONE.sub("[redacted_phone]", text)
+    text = _RE_ID.sub("[redacted_id]", text)
     return text.strip()
 
 
 def get_client():
-    api_key = os.getenv("LINKUP_API_KEY")
-    if not api_key:
-        raise RuntimeError("LINKUP_API_KEY is not set (put it in .env).")
-    if not LinkupClient:
-        raise RuntimeError("linkup-sdk not installed. Run: pip install linkup-sdk")
-    return LinkupClient(api_key=api_key)
+    """Shared LinkupClient (built once, so searches can reuse its HTTP connections)."""
+    global _CLIENT
+    if _CLIENT is None:
+        api_key = os.getenv("LINKUP_API_KEY")
+        if not api_key:
+            raise RuntimeError("LINKUP_API_KEY is not set (put it in .env).")
+        if not LinkupClient:
+            raise RuntimeError("linkup-sdk not installed. Run: pip install linkup-sdk")
+        # worst case two threads race here and one extra client is built
+        _CLIENT = LinkupClient(api_key=api_key)
+    return _CLIENT
 
 
-def _as_dict(obj: Any) -> Dict[str, Any]:
-    """Convert SDK objects to dict if needed."""
-    if isinstance(obj, dict):
-        return obj
-    # some SDKs return pydantic-like objects with .model_dump() or .dict()
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "dict"):
-        return obj.dict()
-    # fallback: try vars
+def _vars_or_value(obj: Any) -> Dict[str, Any]:
     try:
         return dict(vars(obj))
     except Exception:
         return {"value": obj}
 
 
+@lru_cache(maxsize=32)
+def _get_converter(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Resolve the dict conversion once per concrete type instead of probing every object."""
+    if issubclass(cls, dict):
+        return lambda o: o
+    # some SDKs return pydantic-like objects with .model_dump() or .dict()
+    if hasattr(cls, "model_dump"):
+        return methodcaller("model_dump")
+    if hasattr(cls, "dict"):
+        return methodcaller("dict")
+    if dataclasses.is_dataclass(cls):
+        return dataclasses.asdict
+    # fallback: try vars
+    return _vars_or_value
+
+
+def _as_dict(obj: Any) -> Dict[str, Any]:
+    """Convert SDK objects to dict if needed."""
+    return _get_converter(type(obj))(obj)
+
+
 def normalize_linkup_response(raw: Any) -> Dict[str, Any]:
     """
     Force a consistent shape:
@@ -54,14 +186,14 @@ def normalize_linkup_response(raw: Any) -> Dict[str, Any]:
         "message": str | None,
         "answer": str,
         "sources": [{"title": str, "url": str}],
-        "raw": {...}   # for debugging
+        "raw": {...} | None   # full SDK payload, only kept when LINKUP_DEBUG=1
       }
     """
     data = _as_dict(raw)
 
     # Find answer text under common keys
     answer = ""
-    for k in ["answer", "sourcedAnswer", "text", "output", "result"]:
+    for k in _ANSWER_KEYS:
         v = data.get(k)
         if isinstance(v, str) and v.strip():
             answer = v.strip()
@@ -69,26 +201,29 @@ def normalize_linkup_response(raw: Any) -> Dict[str, Any]:
 
     # Find sources under common keys (sources, citations, references)
     sources_raw = None
-    for k in ["sources", "citations", "references"]:
+    for k in _SOURCE_KEYS:
         if k in data and isinstance(data[k], list):
             sources_raw = data[k]
             break
 
     sources: List[Dict[str, str]] = []
     if isinstance(sources_raw, list):
+        # keep the first _MAX_SOURCES usable (URL-bearing) sources; stop converting after that
         for s in sources_raw:
             sd = _as_dict(s)
             url = sd.get("url") or sd.get("link") or sd.get("source") or ""
             title = sd.get("title") or sd.get("name") or sd.get("label") or url
             if isinstance(url, str) and url.strip():
                 sources.append({"title": str(title).strip(), "url": url.strip()})
+                if len(sources) >= _MAX_SOURCES:
+                    break
 
     return {
         "error": bool(data.get("error", False)),
         "message": data.get("message"),
         "answer": answer,
         "sources": sources,
-        "raw": data,  # keep for debug
+        "raw": data if _DEBUG else None,  # don't hold (and cache) full payloads
     }
 
 
@@ -96,17 +231,47 @@ def linkup_search(query: str) -> Dict[str, Any]:
     """
     Calls LinkUp with multiple depth/output combos.
     Returns normalized result with stable keys: answer + sources.
+    Successful sourcedAnswer results are cached in-process for 15 minutes and on disk for
+    LINKUP_CACHE_TTL_SECONDS (default 24h; 0 disables the disk cache).
     """
     safe_query = sanitize_query(query)
 
-    candidates = [
-        ("shallow", "sourcedAnswer"),
-        ("standard", "sourcedAnswer"),
-        ("deep", "sourcedAnswer"),
-        ("shallow", "answer"),
-        ("standard", "answer"),
-        ("shallow", "text"),
-    ]
+    # callers get deep copies: results hold nested lists/dicts (sources) that
+    # callers may mutate, and the cached entry must stay untouched
+    cached = _cache_get(safe_query)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    cached = _disk_cache_get(safe_query)
+    if cached is not None:
+        _cache_put(safe_query, cached)
+        return copy.deepcopy(cached)
+
+    res = _search_uncached(safe_query)
+    # fallback output types come back without sources; don't keep serving those
+    if not res.get("error") and res.get("output_type_used") == _PREFERRED_OUTPUT:
+        _cache_put(safe_query, res)
+        _disk_cache_put(safe_query, res)
+    return copy.deepcopy(res)
+
+
+def _is_transient(err: Exception) -> bool:
+    """Timeouts / 5xx are worth a short back-off; bad params are not."""
+    msg = str(err).lower()
+    if "timeout" in msg or "timed out" in msg:
+        return True
+    return bool(_RE_5XX.search(msg))
+
+
+def _search_uncached(safe_query: str) -> Dict[str, Any]:
+    global _LAST_GOOD, _LAST_GOOD_AT
+
+    candidates = list(_CANDIDATES)
+    # try the combo that last worked first; steady state is one request per call
+    last_good = _LAST_GOOD
+    if last_good in candidates and time.time() - _LAST_GOOD_AT < _LAST_GOOD_TTL_SECONDS:
+        candidates.remove(last_good)
+        candidates.insert(0, last_good)
 
     try:
         client = get_client()
@@ -129,10 +294,14 @@ def linkup_search(query: str) -> Dict[str, Any]:
             normalized["query_used"] = safe_query
             normalized["depth_used"] = depth
             normalized["output_type_used"] = output_type
+            if output_type == _PREFERRED_OUTPUT:
+                _LAST_GOOD = (depth, output_type)
+                _LAST_GOOD_AT = time.time()
             return normalized
         except Exception as e:
             last_err = e
-            time.sleep(0.2)
+            if _is_transient(e):
+                time.sleep(0.2)
 
     return {
         "error": True,
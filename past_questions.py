@@ -3,65 +3,119 @@ from __future__ import annotations
 
 import csv
 import os
+import re
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 from linkup_job import linkup_search
 
+# "question-ish" line: a question mark or one of the usual interview keywords
+_Q_HEURISTIC = re.compile(
+    r"\?|implement|design|explain|difference|time complexity|sql|oop|system",
+    re.IGNORECASE,
+)
+
 CSV_HEADERS = ["company", "role", "stage", "topic", "difficulty", "question", "source", "added_at"]
 
 
+# same company/role strings recur across every row; memoize the normalization
+@lru_cache(maxsize=8192)
 def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
 
 def _cell_to_str(v: Any) -> str:
     """
-    DictReader can produce:
-    - normal strings
-    - None
-    - lists (when a CSV row has extra columns -> stored under key None)
+    Coerce a fetched row value into one CSV cell:
+    None -> "", lists are space-joined, anything else is str()-ed and stripped.
     """
     if v is None:
         return ""
     if isinstance(v, list):
-        # join extra fields back into one cell
+        # join list values into one cell
         return " ".join(str(x) for x in v if x is not None).strip()
     return str(v).strip()
 
 
-def _read_csv(csv_path: str) -> List[Dict[str, str]]:
-    if not os.path.exists(csv_path):
-        return []
-
-    rows: List[Dict[str, str]] = []
+def _iter_csv(csv_path: str) -> Iterator[Dict[str, str]]:
+    """Yield cleaned rows one at a time, so callers never need a second full copy."""
     with open(csv_path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-
-        for r in reader:
-            if not r:
+        # csv.reader + header positions: no per-row DictReader dict / restkey handling
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+
+        n = len(header)
+        cols = list(enumerate(header))
+        missing = [h for h in CSV_HEADERS if h not in header]
+
+        for row in reader:
+            if not row:
                 continue
 
-            clean: Dict[str, str] = {}
-
-            # Handle normal header keys
-            for k, v in r.items():
-                if k is None:
-                    # extra columns (list) -> append to question field
-                    extra = _cell_to_str(v)
+            if len(row) >= n:
+                clean = {h: row[i].strip() for i, h in cols}
+                if len(row) > n:
+                    # extra columns -> append to question field
+                    extra = " ".join(row[n:]).strip()
                     if extra:
                         clean["question"] = (clean.get("question", "") + " " + extra).strip()
-                    continue
-
-                clean[k] = _cell_to_str(v)
+            else:
+                clean = {h: (row[i].strip() if i < len(row) else "") for i, h in cols}
 
             # Ensure all required headers exist
-            for h in CSV_HEADERS:
-                clean.setdefault(h, "")
+            for h in missing:
+                clean[h] = ""
+
+            yield clean
+
+
+# Parsed CSV per path:
+#   {"stamp": (mtime_ns, size), "index": [(company, role, row)], "keys": {(company, role, question)}}
+# Normalized keys live beside the rows (not inside them) so rows stay plain CSV dicts.
+_CSV_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _csv_stamp(csv_path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the CSV, or None if missing — edits change the stamp."""
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _new_entry(stamp: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+    return {"stamp": stamp, "index": [], "keys": set()}
+
+
+def _index_row(entry: Dict[str, Any], row: Dict[str, str]) -> None:
+    """Add a row to a cache entry, normalizing its keys once."""
+    c = _norm(row.get("company"))
+    r = _norm(row.get("role"))
+    entry["index"].append((c, r, row))
+    entry["keys"].add((c, r, _norm(row.get("question"))))
+
+
+def _load_entry(csv_path: str) -> Dict[str, Any]:
+    """Cache entry for csv_path, re-parsed only when the file changes on disk."""
+    stamp = _csv_stamp(csv_path)
+    if stamp is None:
+        _CSV_CACHE.pop(csv_path, None)
+        return _new_entry(None)
 
-            rows.append(clean)
+    hit = _CSV_CACHE.get(csv_path)
+    if hit is not None and hit["stamp"] == stamp:
+        return hit
 
-    return rows
+    entry = _new_entry(stamp)
+    for row in _iter_csv(csv_path):
+        _index_row(entry, row)
+    _CSV_CACHE[csv_path] = entry
+    return entry
 
 
 def _ensure_csv(csv_path: str) -> None:
@@ -72,44 +126,75 @@ def _ensure_csv(csv_path: str) -> None:
         writer.writeheader()
 
 
-def _append_rows(csv_path: str, new_rows: List[Dict[str, str]]) -> None:
+def _append_rows(
+    csv_path: str,
+    new_rows: List[Dict[str, str]],
+    entry: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Append new_rows that aren't already in the CSV, deduping against entry["keys"]
+    (the live cache entry for csv_path) — the file is only opened once, to append.
+    Returns a cache-shaped entry holding just the rows written.
+    """
+    added = _new_entry(None)
     if not new_rows:
-        return
+        return added
+
+    # `entry` was loaded before the (slow) web fetch; if another process changed the
+    # file since, re-read it so dedupe and the cached rows match what's on disk
+    if _csv_stamp(csv_path) != entry["stamp"]:
+        entry = _load_entry(csv_path)
 
     _ensure_csv(csv_path)
 
-    existing = _read_csv(csv_path)
-    seen = set((_norm(r.get("company")), _norm(r.get("role")), _norm(r.get("question"))) for r in existing)
+    seen = entry["keys"]
+    batch_keys = set()
+    # cells pre-ordered like CSV_HEADERS, so csv.writer needs no per-field dict lookups
+    out_rows: List[Tuple[str, ...]] = []
+    for r in new_rows:
+        key = (_norm(r.get("company")), _norm(r.get("role")), _norm(r.get("question")))
+        if key in seen or key in batch_keys:
+            continue
+        batch_keys.add(key)
+        out_rows.append(tuple(_cell_to_str(r.get(h, "")) for h in CSV_HEADERS))
 
-    with open(csv_path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
+    if not out_rows:
+        return added
 
-        for r in new_rows:
-            key = (_norm(r.get("company")), _norm(r.get("role")), _norm(r.get("question")))
-            if key in seen:
-                continue
-            seen.add(key)
+    # header is written by _ensure_csv
+    with open(csv_path, "a", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        csv.writer(f).writerows(out_rows)
 
-            row_out = {h: _cell_to_str(r.get(h, "")) for h in CSV_HEADERS}
-            writer.writerow(row_out)
+    # only cache rows once they are on disk; a failed write leaves the cache untouched
+    for cells in out_rows:
+        row_out = dict(zip(CSV_HEADERS, cells))
+        _index_row(entry, row_out)
+        _index_row(added, row_out)
 
+    entry["stamp"] = _csv_stamp(csv_path)
+    _CSV_CACHE[csv_path] = entry
+    return added
 
-def _filter_matches(rows: List[Dict[str, str]], company: str, role: str) -> List[Dict[str, str]]:
+
+def _filter_matches(
+    index: Iterable[Tuple[str, str, Dict[str, str]]],
+    company: str,
+    role: str,
+) -> Iterator[Dict[str, str]]:
+    """
+    Lazily yield rows matching company/role from pre-normalized (company, role, row) tuples.
+    Wrap in islice to stop scanning once enough matches are found.
+    """
     c = _norm(company)
     r = _norm(role)
 
-    out = []
-    for row in rows:
-        rc = _norm(row.get("company"))
-        rr = _norm(row.get("role"))
-
+    for rc, rr, row in index:
         # partial match for flexibility
         if c and c not in rc:
             continue
         if r and r not in rr:
             continue
-        out.append(row)
-    return out
+        yield row
 
 
 def _parse_questions_from_linkup(answer: str, company: str, role: str) -> List[Dict[str, str]]:
@@ -126,10 +211,7 @@ def _parse_questions_from_linkup(answer: str, company: str, role: str) -> List[D
             ln = ln[:200].rsplit(" ", 1)[0] + "..."
 
         # "question-ish" heuristic
-        low = ln.lower()
-        if "?" not in ln and not any(
-            k in low for k in ["implement", "design", "explain", "difference", "time complexity", "sql", "oop", "system"]
-        ):
+        if not _Q_HEURISTIC.search(ln):
             continue
 
         out.append({
@@ -175,19 +257,22 @@ def get_past_questions(
     auto_fetch_if_missing: bool = True,
 ) -> List[Dict[str, str]]:
 
-    rows = _read_csv(csv_path)
-    matches = _filter_matches(rows, company, role)
+    if limit <= 0:
+        return []
+
+    entry = _load_entry(csv_path)
+    matches = list(islice(_filter_matches(entry["index"], company, role), limit))
 
     if matches:
-        return matches[:limit]
+        return matches
 
     if not auto_fetch_if_missing:
         return []
 
     fetched = fetch_past_questions_from_web(company, role, limit=limit)
-    if fetched:
-        _append_rows(csv_path, fetched)
+    if not fetched:
+        return []
 
-    rows2 = _read_csv(csv_path)
-    matches2 = _filter_matches(rows2, company, role)
-    return matches2[:limit]
+    # Nothing cached matched, so only the newly written rows can
+    added = _append_rows(csv_path, fetched, entry)
+    return list(islice(_filter_matches(added["index"], company, role), limit))
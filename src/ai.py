@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel
 
@@ -8,6 +9,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 
 from googleapiclient.discovery import build
 from utils.auth import get_calendar_credentials
+from llm_cache import cache_get, cache_put, make_key
 
 class CalendarEvent(BaseModel):
     summary: str
@@ -18,44 +20,89 @@ class CalendarEvent(BaseModel):
     endDateTime: str
     endTimeZone: str
 
-def extract_event(text: str, timezone: str, current_date: str) -> CalendarEvent:
-    llm = OllamaLLM(
-        model="llama3",
-        temperature=0
-    )
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a precise calendar assistant. Output valid JSON only."),
-        ("human", f"""
-            Extract a calendar event from the text below and return ONLY valid JSON.
-
-            Text: "{text}"
-
-            Current date: {current_date}
-            Timezone: {timezone}
+# Bump when the prompt changes so cached extractions from the old prompt are ignored
+PROMPT_VERSION = "v1"
+
+# Everything static lives in the system message so Ollama can reuse the prompt-prefix
+# KV cache across emails; only the per-email fields go in the human message at the end.
+_SYSTEM_PROMPT = """You are a precise calendar assistant. Output valid JSON only.
+
+Extract a calendar event from the text the user provides and return ONLY valid JSON.
+
+Return JSON with these exact fields (string values):
+- summary: event title
+- description: event description (or null)
+- location: event location (or null)
+- startDateTime: ISO-8601 datetime
+- startTimeZone: timezone string
+- endDateTime: ISO-8601 datetime
+- endTimeZone: timezone string
+
+Output ONLY the JSON object, no other text."""
+
+_HUMAN_PROMPT = """Text: "{text}"
+
+Current date: {current_date}
+Timezone: {timezone}"""
+
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _SYSTEM_PROMPT),
+    ("human", _HUMAN_PROMPT),
+])
+
+# Built once at import and reused for every email (the client keeps its connection pool)
+_MODEL = "llama3"
+_LLM = OllamaLLM(
+    model=_MODEL,
+    temperature=0
+)
+_PARSER = PydanticOutputParser(pydantic_object=CalendarEvent)
+_CHAIN = _PROMPT | _LLM | _PARSER
+
+def _cache_key(text: str, timezone: str, current_date: str) -> str:
+    return make_key(_MODEL, PROMPT_VERSION, text, timezone, current_date)
+
+def _cached_event(key: str) -> Optional[CalendarEvent]:
+    cached = cache_get(key)
+    if cached is None:
+        return None
+    try:
+        return CalendarEvent.model_validate_json(cached)
+    except ValueError:
+        return None
 
-            Return JSON with these exact fields (string values):
-            - summary: event title
-            - description: event description (or null)
-            - location: event location (or null)
-            - startDateTime: ISO-8601 datetime
-            - startTimeZone: timezone string
-            - endDateTime: ISO-8601 datetime
-            - endTimeZone: timezone string
+def extract_event(text: str, timezone: str, current_date: str) -> CalendarEvent:
+    # temperature=0, so the same email/date/timezone gives the same event — skip the LLM on repeats
+    key = _cache_key(text, timezone, current_date)
+    event = _cached_event(key)
+    if event is not None:
+        return event
 
-            Output ONLY the JSON object, no other text.
-        """)
-    ])
+    event = _CHAIN.invoke({
+        "text": text,
+        "timezone": timezone,
+        "current_date": current_date
+    })
+    cache_put(key, event.model_dump_json())
+    return event
 
-    parser = PydanticOutputParser(pydantic_object=CalendarEvent)
-    chain = prompt | llm | parser
+async def aextract_event(text: str, timezone: str, current_date: str) -> CalendarEvent:
+    """Async extract_event, so several emails can be in flight against Ollama at once."""
+    key = _cache_key(text, timezone, current_date)
+    event = _cached_event(key)
+    if event is not None:
+        return event
 
-    return chain.invoke({
+    event = await _CHAIN.ainvoke({
         "text": text,
         "timezone": timezone,
         "current_date": current_date
     })
+    cache_put(key, event.model_dump_json())
+    return event
 
+# Built once and reused by every create_event call (its transport refreshes expired tokens)
+@lru_cache(maxsize=None)
 def get_calendar_service():
     creds = get_calendar_credentials()
     return build("calendar", "v3", credentials=creds)
@@ -8,6 +8,7 @@ Features:
 """
 
 import base64
+from functools import lru_cache
 from googleapiclient.discovery import build
 from bs4 import BeautifulSoup
 from utils.auth import get_gmail_credentials
@@ -15,9 +16,11 @@ from utils.auth import get_gmail_credentials
 # =========================
 # Gmail service
 # =========================
+@lru_cache(maxsize=None)
 def get_gmail_service():
     """
     Authenticate using token_gmail.json (OAuth2) and return Gmail API service
+    (built once per process and shared)
     """
     creds = get_gmail_credentials()
     service = build("gmail", "v1", credentials=creds)
@@ -44,32 +47,85 @@ def list_unread_emails(service, max_results=5):
 # =========================
 def get_email_content(service, msg_id):
     """
-    Get subject, sender, and body of an email
+    Get subject, sender, and body of an email (None if it has no text body)
     """
     message = service.users().messages().get(userId="me", id=msg_id, format="full").execute()
-    headers = message.get("payload", {}).get("headers", [])
+    return _parse_message(message)
+
+# Gmail recommends keeping batches at or under 50 requests
+_BATCH_SIZE = 50
+
+def get_email_contents(service, msg_ids):
+    """
+    Like get_email_content for several messages, fetched with batched HTTP requests
+    (one round-trip per 50 messages). Results are in msg_ids order; a message with
+    no text body is None, and one that failed to fetch or parse appears as its exception.
+    """
+    results = {}
+
+    def _store(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = exception
+            return
+        try:
+            results[request_id] = _parse_message(response)
+        except Exception as e:
+            results[request_id] = e
+
+    for start in range(0, len(msg_ids), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_store)
+        for i, msg_id in enumerate(msg_ids[start:start + _BATCH_SIZE], start):
+            batch.add(
+                service.users().messages().get(userId="me", id=msg_id, format="full"),
+                request_id=str(i),
+            )
+        batch.execute()
+
+    return [results.get(str(i)) for i in range(len(msg_ids))]
+
+def _walk_text_parts(payload):
+    """Yield text/* leaf parts that carry data, in document order, descending into nested multiparts"""
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        children = part.get("parts")
+        if children:
+            stack.extend(reversed(children))
+        elif part.get("mimeType", "text/plain").startswith("text/") and part.get("body", {}).get("data"):
+            yield part
+
+def _extract_body(payload):
+    """
+    Decode the first text/plain leaf, else the first text/html leaf (as text).
+    Only the chosen part is decoded; None if the message has neither.
+    """
+    html_part = None
+    for part in _walk_text_parts(payload):
+        mime = part.get("mimeType", "text/plain")
+        if mime == "text/plain":
+            return base64.urlsafe_b64decode(part["body"]["data"]).decode("UTF-8")
+        if mime == "text/html" and html_part is None:
+            html_part = part
+
+    if html_part is None:
+        return None
+    html = base64.urlsafe_b64decode(html_part["body"]["data"]).decode("UTF-8")
+    # Convert HTML to text
+    return BeautifulSoup(html, "html.parser").get_text()
+
+def _parse_message(message):
+    """
+    Subject, sender and body from a full-format Gmail message,
+    or None when there is no readable body (nothing worth sending to the AI)
+    """
+    payload = message.get("payload", {})
+    headers = payload.get("headers", [])
     subject = next((h["value"] for h in headers if h["name"] == "Subject"), "")
     sender = next((h["value"] for h in headers if h["name"] == "From"), "")
 
-    # Extract body
-    parts = message.get("payload", {}).get("parts", [])
-    body = ""
-
-    if parts:
-        for part in parts:
-            if part.get("mimeType") == "text/plain":
-                data = part["body"].get("data", "")
-                body = base64.urlsafe_b64decode(data.encode("UTF-8")).decode("UTF-8")
-            elif part.get("mimeType") == "text/html":
-                data = part["body"].get("data", "")
-                html = base64.urlsafe_b64decode(data.encode("UTF-8")).decode("UTF-8")
-                # Convert HTML to text
-                body = BeautifulSoup(html, "html.parser").get_text()
-    else:
-        # Single part email
-        data = message.get("payload", {}).get("body", {}).get("data", "")
-        if data:
-            body = base64.urlsafe_b64decode(data.encode("UTF-8")).decode("UTF-8")
+    body = _extract_body(payload)
+    if not body or not body.strip():
+        return None
 
     return {
         "subject": subject,
@@ -86,6 +142,9 @@ if __name__ == "__main__":
     else:
         for i, msg in enumerate(messages, 1):
             email_content = get_email_content(service, msg["id"])
+            if email_content is None:
+                print(f"\n--- Email {i} --- (no text body)")
+                continue
             print(f"\n--- Email {i} ---")
             print(f"From: {email_content['from']}")
             print(f"Subject: {email_content['subject']}")
@@ -1,32 +1,70 @@
 # import datetime
-from email_reader import get_email_content, get_gmail_service, list_unread_emails
-from ai import extract_event, create_event  # your previous calendar file
+import asyncio
+import os
 from datetime import datetime
 
+# Ollama reads this when its server starts (it can't change an already-running server);
+# we also use it to cap how many extraction requests are in flight at once.
+os.environ.setdefault("OLLAMA_NUM_PARALLEL", "4")
+
+from email_reader import get_email_contents, get_gmail_service, list_unread_emails
+from ai import aextract_event, create_event  # your previous calendar file
+
+TIMEZONE = "America/New_York"
 current_date = datetime.now().strftime("%Y-%m-%d")
 
+
+def _max_in_flight():
+    # a pre-set value may be "0" (Ollama's "auto") or junk; never build Semaphore(0)
+    try:
+        n = int(os.environ["OLLAMA_NUM_PARALLEL"])
+    except ValueError:
+        n = 4
+    return max(1, n)
+
+
+async def _extract_all(email_texts):
+    sem = asyncio.Semaphore(_max_in_flight())
+
+    async def _one(text):
+        async with sem:
+            return await aextract_event(text, timezone=TIMEZONE, current_date=current_date)
+
+    # one failed email shouldn't cancel the rest
+    return await asyncio.gather(*(_one(t) for t in email_texts), return_exceptions=True)
+
+
 service = get_gmail_service()
 messages = list_unread_emails(service, max_results=5)
 
 if not messages:
     print("No unread emails found.")
 else:
-    for msg in messages:
+    email_texts = []
+    # all bodies come back in one batched Gmail request
+    for content in get_email_contents(service, [msg["id"] for msg in messages]):
+        if isinstance(content, Exception):
+            print(f"⚠️  Could not read email: {str(content)[:100]}")
+            continue
+        if content is None:
+            # no text body — nothing for the LLM to extract
+            continue
+        # Combine subject and body for better event extraction
+        email_texts.append(f"Subject: {content['subject']}\n\nBody: {content['body'][:500]}")
+
+    for event in asyncio.run(_extract_all(email_texts)):
+        if isinstance(event, Exception):
+            print(f"⚠️  Could not extract event from email: {str(event)[:100]}")
+            continue
+
+        # Only create event if summary is not empty
+        if not (event.summary and event.summary.strip()):
+            continue
         try:
-            content = get_email_content(service, msg["id"])
-            # Combine subject and body for better event extraction
-            email_text = f"Subject: {content['subject']}\n\nBody: {content['body'][:500]}"
-            
-            event = extract_event(email_text, timezone="America/New_York", current_date=current_date)
-            
-            # Only create event if summary is not empty
-            if event.summary and event.summary.strip():
-                link = create_event(event)
-                print(f"✅ Created calendar event: {link}")
-                print(f"   Event: {event.summary}")
-                break
+            link = create_event(event)
+            print(f"✅ Created calendar event: {link}")
+            print(f"   Event: {event.summary}")
         except Exception as e:
-            print(f"⚠️  Could not extract event from email: {str(e)[:100]}")
-            continue
+            print(f"⚠️  Could not create event: {str(e)[:100]}")
 
-print("Done!")
\ No newline at end of file
+print("Done!")
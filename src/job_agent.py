@@ -4,13 +4,34 @@ import json
 from datetime import datetime
 from pathlib import Path
 import os
+from llm_cache import cache_get, cache_put, make_key
 load_dotenv()
 
+# Linkup results are paid calls; cached under $CACHE_DIR/linkup_jobs/ (see "Caching" in the README)
+LINKUP_CACHE_TTL_SECONDS = int(os.getenv("LINKUP_CACHE_TTL_SECONDS", str(24 * 3600)))
+_LINKUP_CACHE_NAMESPACE = "linkup_jobs"
+
 try:
     from linkup import LinkupClient
 except Exception:
     LinkupClient = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Same optional-orjson pattern as storage.py (scripts in src/ can't import root modules)
+def _json_loads(data: bytes):
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _json_line(obj) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
 class JobIntelligenceAgent:
     def __init__(self):
         api_key = os.getenv("LINKUP_API_KEY")
@@ -28,48 +49,111 @@ class JobIntelligenceAgent:
         self.storage_path = Path("output/jobs.txt")
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self.applications = []
+        # dedupe indexes: every saved url, and (company, role, title) for url-less jobs
+        self._seen_urls = set()
+        self._seen_triples = set()
         self._load_jobs()
 
+        # Buffered append handle, opened on the first save and kept for the session
+        # instead of an open/close per job; see flush_jobs() / close()
+        self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _load_jobs(self):
         if not self.storage_path.exists():
             return
-        with open(self.storage_path, "r", encoding="utf-8") as f:
+        with open(self.storage_path, "rb") as f:
             for line in f:
                 try:
-                    self.applications.append(json.loads(line.strip()))
+                    job = _json_loads(line.strip())
                 except:
-                    pass
+                    continue
+                if not isinstance(job, dict):
+                    continue
+                self.applications.append(job)
+                self._index_job(job)
+
+    def _index_job(self, job):
+        if job.get("url"):
+            self._seen_urls.add(job["url"])
+        self._seen_triples.add((job.get("company"), job.get("role"), job.get("title")))
 
     def _save_job(self, job):
-        with open(self.storage_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(job) + "\n")
+        if self._fh is None:
+            self._fh = open(self.storage_path, "ab", buffering=1 << 16)
+        self._fh.write(_json_line(job))
 
-    def fetch_recent_jobs(self, company, role, max_results=10):
-        """Fetch recent job-related sources using Linkup and return normalized job entries.
-        Falls back gracefully if Linkup client is not available.
+    def flush_jobs(self):
+        """Push buffered job lines to disk (unflushed lines are lost on a hard kill)."""
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self):
+        """Flush and close the jobs file; a later save reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _search_sources(self, query, depth, max_results):
         """
-        if not self.linkup:
-            print("Linkup client unavailable — cannot fetch real-time jobs")
-            return []
-        
-        query = f"{company} {role} recent job postings"
+        Linkup sourcedAnswer sources as plain {url, name, snippet} dicts, cached on disk
+        by (query, depth, max_results). Returns None if the search failed.
+        """
+        key = make_key("linkup", query, depth, "sourcedAnswer", max_results)
+        cached = cache_get(key, ttl_seconds=LINKUP_CACHE_TTL_SECONDS, namespace=_LINKUP_CACHE_NAMESPACE)
+        if cached is not None:
+            print(f"   ↪ Using cached Linkup results: {query}")
+            return json.loads(cached)
+
         print(f"   ↪ Running Linkup search: {query}")
         try:
             resp = self.linkup.search(
                 query=query,
-                depth="deep",
+                depth=depth,
                 output_type="sourcedAnswer",
                 max_results=max_results
             )
         except Exception as e:
             print(f"   ⚠ Linkup search error: {e}")
-            return []
+            return None
 
-        sources = None
         if isinstance(resp, dict):
-            sources = resp.get("sources")
+            raw_sources = resp.get("sources")
         else:
-            sources = getattr(resp, "sources", None)
+            raw_sources = getattr(resp, "sources", None)
+
+        sources = []
+        for s in raw_sources or []:
+            # support dict-like and object-like sources
+            if isinstance(s, dict):
+                url, name, snippet = s.get("url"), s.get("name"), s.get("snippet")
+            else:
+                url = getattr(s, "url", None)
+                name = getattr(s, "name", None)
+                snippet = getattr(s, "snippet", None)
+            sources.append({"url": url, "name": name, "snippet": snippet})
+
+        if sources and LINKUP_CACHE_TTL_SECONDS > 0:
+            cache_put(key, json.dumps(sources), namespace=_LINKUP_CACHE_NAMESPACE)
+        return sources
+
+    def fetch_recent_jobs(self, company, role, max_results=10):
+        """Fetch recent job-related sources using Linkup and return normalized job entries.
+        Falls back gracefully if Linkup client is not available.
+        """
+        if not self.linkup:
+            print("Linkup client unavailable — cannot fetch real-time jobs")
+            return []
+        
+        query = f"{company} {role} recent job postings"
+        sources = self._search_sources(query, depth="deep", max_results=max_results)
+        if sources is None:
+            return []
 
         if not sources:
             print("   ✓ Linkup returned no sources")
@@ -78,10 +162,9 @@ class JobIntelligenceAgent:
         jobs = []
         seen = set()
         for s in sources:
-            # support dict-like and object-like sources
-            url = s.get("url") if isinstance(s, dict) else getattr(s, "url", None)
-            name = s.get("name") if isinstance(s, dict) else getattr(s, "name", None)
-            snippet = s.get("snippet") if isinstance(s, dict) else getattr(s, "snippet", None)
+            url = s.get("url")
+            name = s.get("name")
+            snippet = s.get("snippet")
             if not url:
                 continue
             if url in seen:
@@ -101,15 +184,14 @@ class JobIntelligenceAgent:
         return jobs
 
     def dedupe_and_add(self, job):
-        for existing in self.applications:
-            if job.get("url") and existing.get("url") and existing["url"] == job["url"]:
-                return False
-            if (not job.get("url") and
-                existing.get("company") == job.get("company") and
-                existing.get("role") == job.get("role") and
-                existing.get("title") == job.get("title")):
+        url = job.get("url")
+        if url:
+            if url in self._seen_urls:
                 return False
+        elif (job.get("company"), job.get("role"), job.get("title")) in self._seen_triples:
+            return False
 
         self.applications.append(job)
+        self._index_job(job)
         self._save_job(job)
-        return True
\ No newline at end of file
+        return True
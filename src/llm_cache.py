@@ -0,0 +1,57 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Disk cache layout and expiry rules are described under "Caching" in the README;
+# linkup_job.py's Linkup cache follows the same ones (src/ can't import it).
+CACHE_ROOT = Path(os.getenv("CACHE_DIR") or Path(__file__).resolve().parent.parent / "cache")
+DEFAULT_NAMESPACE = "llm"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def make_key(*parts) -> str:
+    """sha256 over the '|'-joined parts — include a prompt/model version so bumps invalidate."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str, namespace: str) -> Path:
+    return CACHE_ROOT / namespace / f"{key}.json"
+
+
+def cache_get(
+    key: str,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    namespace: str = DEFAULT_NAMESPACE,
+) -> Optional[str]:
+    """Cached value for key, or None if missing, unreadable or older than ttl_seconds."""
+    path = _entry_path(key, namespace)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    return entry.get("value")
+
+
+def cache_put(key: str, value: str, namespace: str = DEFAULT_NAMESPACE) -> None:
+    """Store value under key (best-effort)."""
+    path = _entry_path(key, namespace)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"value": value}, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
@@ -8,11 +8,17 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 import os
 import json
+import threading
 
 # Define scopes for each service
 GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 CALENDAR_SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Credentials loaded this process, keyed by (service_name, scopes, token_file);
+# the token file is only read on first use and only written after a refresh/login
+_CREDS = {}
+_CREDS_LOCK = threading.Lock()
+
 def authenticate(service_name, scopes, token_file="token.json"):
     """
     Generic authentication function for Google APIs
@@ -25,9 +31,16 @@ def authenticate(service_name, scopes, token_file="token.json"):
     Returns:
         Credentials object
     """
-    creds = None
+    key = (service_name, tuple(scopes), token_file)
+    with _CREDS_LOCK:
+        return _authenticate_locked(key, scopes, token_file)
+
+def _authenticate_locked(key, scopes, token_file):
+    creds = _CREDS.get(key)
+    if creds and creds.valid:
+        return creds
     
-    if os.path.exists(token_file):
+    if creds is None and os.path.exists(token_file):
         try:
             creds = Credentials.from_authorized_user_file(token_file, scopes)
         except:
@@ -46,6 +59,7 @@ def authenticate(service_name, scopes, token_file="token.json"):
         with open(token_file, "w") as token:
             token.write(creds.to_json())
     
+    _CREDS[key] = creds
     return creds
 
 def get_gmail_credentials(token_file="token_gmail.json"):
@@ -4,25 +4,55 @@ from pathlib import Path
 from datetime import datetime
 import csv
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 DB_PATH = Path("job_applications.json")
 CSV_PATH = Path("job_applications.csv")
 
+def _json_loads(data: bytes):
+    # orjson parses bytes directly and is several times faster than stdlib json
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _json_dumps(obj) -> bytes:
+    if orjson:
+        # OPT_NON_STR_KEYS: stringify int/etc. keys like stdlib json instead of raising
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 def load_db():
     if DB_PATH.exists():
         try:
-            return json.loads(DB_PATH.read_text())
+            return _json_loads(DB_PATH.read_bytes())
         except Exception:
             return []
     return []
 
 def save_db(rows):
-    DB_PATH.write_text(json.dumps(rows, indent=2))
+    DB_PATH.write_bytes(_json_dumps(rows))
 
-def upsert_application(rows, company, role):
+def build_index(rows):
+    """(company, role) -> latest row, for O(1) upsert_application lookups."""
+    return {(r.get("company"), r.get("role")): r for r in rows}
+
+def upsert_application(rows, company, role, index=None):
     # find latest entry for company+role, else create
-    for r in reversed(rows):
-        if r.get("company") == company and r.get("role") == role:
-            return r
+    # pass index=build_index(rows) when upserting many times against the same rows
+    if index is not None:
+        hit = index.get((company, role))
+        if hit is not None:
+            return hit
+    else:
+        for r in reversed(rows):
+            if r.get("company") == company and r.get("role") == role:
+                return r
     new_row = {
         "company": company,
         "role": role,
@@ -31,6 +61,8 @@ def upsert_application(rows, company, role):
         "notes_file": "",
     }
     rows.append(new_row)
+    if index is not None:
+        index[(company, role)] = new_row
     return new_row
 
 def add_referrals(app_entry, candidates):
@@ -48,47 +80,41 @@ def add_referrals(app_entry, candidates):
         added += 1
     return added
 
+_EXPORT_FIELDS = (
+    "company",
+    "role",
+    "last_updated",
+    "notes_file",
+    "recent_job_posts_count",
+    "referrals_count",
+    "known_contacts_count",
+    "interviews_scheduled_count",
+)
+
+def _export_rows(db):
+    # one flat tuple per application, in _EXPORT_FIELDS order
+    for app in db:
+        yield (
+            app.get("company", ""),
+            app.get("role", ""),
+            app.get("last_updated", app.get("created_at", "")),
+            app.get("notes_file", ""),
+            len(app.get("recent_job_postings", []) or []),
+            len(app.get("referrals", []) or []),
+            len(app.get("internal_contacts", []) or []),
+            len(app.get("interviews", []) or []),
+        )
+
 def export_csv(db, csv_path="job_applications.csv"):
     """
     Export a clean, candidate-friendly CSV.
     Avoid nested JSON fields (referrals/interviews/contacts) to prevent schema errors.
     """
-    import csv
-
-    rows = []
-    for app in db:
-        referrals = app.get("referrals", []) or []
-        interviews = app.get("interviews", []) or []
-        contacts = app.get("internal_contacts", []) or []
-        jobs = app.get("recent_job_postings", []) or []
-
-        rows.append({
-            "company": app.get("company", ""),
-            "role": app.get("role", ""),
-            "last_updated": app.get("last_updated", app.get("created_at", "")),
-            "notes_file": app.get("notes_file", ""),
-            "recent_job_posts_count": len(jobs),
-            "referrals_count": len(referrals),
-            "known_contacts_count": len(contacts),
-            "interviews_scheduled_count": len(interviews),
-        })
-
-    fieldnames = [
-        "company",
-        "role",
-        "last_updated",
-        "notes_file",
-        "recent_job_posts_count",
-        "referrals_count",
-        "known_contacts_count",
-        "interviews_scheduled_count",
-    ]
-
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        w = csv.writer(f)
+        w.writerow(_EXPORT_FIELDS)
+        # rows stream straight from the generator; no intermediate list of dicts
+        w.writerows(_export_rows(db))
 
 def has_scheduled_interview(rows, message_id: str) -> bool:
     for r in rows: